@@ -9,8 +9,9 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 
-from .const import DOMAIN
+from .const import CONF_GROUP_MEMBERS, DOMAIN, SIGNAL_MEMBER_REMOVED
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -21,20 +22,30 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Polar Bluetooth from a config entry."""
     _LOGGER.debug("Setting up Polar Bluetooth integration")
     
-    # Verify Bluetooth is available
-    if not bluetooth.async_scanner_count(hass, connectable=True):
+    # Verify Bluetooth is available (group entries have no device of their own)
+    if CONF_GROUP_MEMBERS not in entry.data and not bluetooth.async_scanner_count(
+        hass, connectable=True
+    ):
         raise ConfigEntryNotReady("No Bluetooth adapter found")
     
-    # Store the entry data
+    # Store the entry data (replaced by the coordinator once the sensor platform is set up)
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = entry.data
     
     # Forward the setup to the sensor platform
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     
+    # Reload on options change so groups pick up a member's new max heart rate
+    entry.async_on_unload(entry.add_update_listener(async_update_options))
+    
     return True
 
 
+async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the config entry after its options changed."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     _LOGGER.debug("Unloading Polar Bluetooth integration")
@@ -43,5 +54,6 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id)
+        async_dispatcher_send(hass, SIGNAL_MEMBER_REMOVED, entry.entry_id)
     
     return unload_ok
@@ -0,0 +1,108 @@
+"""Running heart rate aggregates for Polar sensor groups."""
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Sequence
+from typing import Any
+
+
+class HeartRateAggregate:
+    """Running average, max and zone counts over the members of a group.
+
+    Each member update adjusts the aggregates by the difference between the
+    member's previous and current heart rate, so the cost of an update does not
+    depend on the group size. Zones are relative to each member's own max heart
+    rate, falling back to the group default.
+    """
+
+    def __init__(self, max_heart_rate: int, zones: Sequence[int]) -> None:
+        """Initialize."""
+        self._max_heart_rate = max_heart_rate
+        self._zones = tuple(zones)
+        
+        # Heart rate and zone of the members currently in contact
+        self._heart_rates: dict[str, tuple[int, int | None]] = {}
+        self._heart_rate_sum = 0
+        self._heart_rate_counts: Counter[int] = Counter()
+        self._heart_rate_max: int | None = None
+        self._zone_counts = [0] * len(self._zones)
+
+    def set_member(
+        self,
+        member_id: str,
+        heart_rate: int | None,
+        max_heart_rate: int | None = None,
+    ) -> bool:
+        """Replace a member's contribution, None meaning out of contact.
+
+        Returns True if the aggregates changed.
+        """
+        current = None
+        if heart_rate is not None:
+            current = (heart_rate, self.zone(heart_rate, max_heart_rate))
+        
+        previous = self._heart_rates.get(member_id)
+        if previous == current:
+            return False
+        
+        if previous is not None:
+            del self._heart_rates[member_id]
+            self._remove_heart_rate(*previous)
+        if current is not None:
+            self._heart_rates[member_id] = current
+            self._add_heart_rate(*current)
+        
+        return True
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a snapshot of the aggregates."""
+        active = len(self._heart_rates)
+        
+        return {
+            "active": active,
+            "average": round(self._heart_rate_sum / active, 1) if active else None,
+            "max": self._heart_rate_max,
+            "zones": [
+                round(count * 100 / active, 1) if active else None
+                for count in self._zone_counts
+            ],
+        }
+
+    def _add_heart_rate(self, heart_rate: int, zone: int | None) -> None:
+        """Add a heart rate to the aggregates."""
+        self._heart_rate_sum += heart_rate
+        self._heart_rate_counts[heart_rate] += 1
+        if self._heart_rate_max is None or heart_rate > self._heart_rate_max:
+            self._heart_rate_max = heart_rate
+        if zone is not None:
+            self._zone_counts[zone] += 1
+
+    def _remove_heart_rate(self, heart_rate: int, zone: int | None) -> None:
+        """Remove a heart rate from the aggregates."""
+        self._heart_rate_sum -= heart_rate
+        self._heart_rate_counts[heart_rate] -= 1
+        if not self._heart_rate_counts[heart_rate]:
+            del self._heart_rate_counts[heart_rate]
+            if heart_rate == self._heart_rate_max:
+                # Walk down to the next occupied value; bounded by the BPM
+                # range rather than the number of members
+                self._heart_rate_max = next(
+                    (
+                        value
+                        for value in range(heart_rate - 1, -1, -1)
+                        if value in self._heart_rate_counts
+                    ),
+                    None,
+                )
+        if zone is not None:
+            self._zone_counts[zone] -= 1
+
+    def zone(
+        self, heart_rate: int, max_heart_rate: int | None = None
+    ) -> int | None:
+        """Return the zone index for a heart rate, or None below zone 1."""
+        percent = heart_rate * 100 / (max_heart_rate or self._max_heart_rate)
+        for zone in range(len(self._zones) - 1, -1, -1):
+            if percent >= self._zones[zone]:
+                return zone
+        return None
@@ -10,20 +10,38 @@ from homeassistant.components.bluetooth import (
     BluetoothServiceInfoBleak,
     async_discovered_service_info,
 )
-from homeassistant.config_entries import ConfigFlow
+from homeassistant.config_entries import ConfigEntry, ConfigFlow, OptionsFlow
 from homeassistant.const import CONF_ADDRESS
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
+import homeassistant.helpers.config_validation as cv
 
-from .const import CONF_DEVICE_ADDRESS, CONF_DEVICE_NAME, DOMAIN
+from .const import (
+    CONF_DEVICE_ADDRESS,
+    CONF_DEVICE_NAME,
+    CONF_GROUP_MEMBERS,
+    CONF_GROUP_NAME,
+    CONF_MAX_HEART_RATE,
+    DEFAULT_MAX_HEART_RATE,
+    DOMAIN,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+MAX_HEART_RATE_SCHEMA = vol.All(vol.Coerce(int), vol.Range(min=100, max=250))
+
 
 class PolarBluetoothConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Polar Bluetooth."""
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlow:
+        """Get the options flow for this handler."""
+        return PolarBluetoothOptionsFlow(config_entry)
+
     def __init__(self) -> None:
         """Initialize the config flow."""
         self._discovery_info: BluetoothServiceInfoBleak | None = None
@@ -94,9 +112,21 @@ class PolarBluetoothConfigFlow(ConfigFlow, domain=DOMAIN):
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
-        """Handle the user step to pick discovered device."""
+        """Handle the user step, offering to create a group once straps exist."""
         _LOGGER.info("async_step_user called - Manual setup initiated")
         
+        if not self._async_device_entries():
+            return await self.async_step_pick_device()
+        
+        return self.async_show_menu(
+            step_id="user",
+            menu_options=["pick_device", "group"],
+        )
+
+    async def async_step_pick_device(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Handle the step to pick discovered device."""
         if user_input is not None:
             address = user_input[CONF_ADDRESS]
             _LOGGER.info("User selected device: %s", address)
@@ -174,6 +204,96 @@ class PolarBluetoothConfigFlow(ConfigFlow, domain=DOMAIN):
         )
 
         return self.async_show_form(
-            step_id="user",
+            step_id="pick_device",
             data_schema=data_schema,
         )
+
+    async def async_step_group(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Handle the step to create a group of configured straps."""
+        members = {
+            entry.entry_id: entry.title for entry in self._async_device_entries()
+        }
+        errors: dict[str, str] = {}
+        
+        if user_input is not None:
+            if not user_input[CONF_GROUP_MEMBERS]:
+                errors[CONF_GROUP_MEMBERS] = "no_members"
+            else:
+                _LOGGER.info("Creating group %s with %d members",
+                            user_input[CONF_GROUP_NAME],
+                            len(user_input[CONF_GROUP_MEMBERS]))
+                return self.async_create_entry(
+                    title=user_input[CONF_GROUP_NAME],
+                    data={
+                        CONF_GROUP_NAME: user_input[CONF_GROUP_NAME],
+                        CONF_GROUP_MEMBERS: list(user_input[CONF_GROUP_MEMBERS]),
+                        CONF_MAX_HEART_RATE: user_input[CONF_MAX_HEART_RATE],
+                    },
+                )
+
+        data_schema = vol.Schema(
+            {
+                vol.Required(CONF_GROUP_NAME): str,
+                vol.Required(CONF_GROUP_MEMBERS): cv.multi_select(members),
+                vol.Required(
+                    CONF_MAX_HEART_RATE, default=DEFAULT_MAX_HEART_RATE
+                ): MAX_HEART_RATE_SCHEMA,
+            }
+        )
+
+        return self.async_show_form(
+            step_id="group",
+            data_schema=data_schema,
+            errors=errors,
+        )
+
+    def _async_device_entries(self) -> list[ConfigEntry]:
+        """Return the configured strap entries (excluding groups)."""
+        return [
+            entry
+            for entry in self._async_current_entries(include_ignore=False)
+            if CONF_DEVICE_ADDRESS in entry.data
+        ]
+
+
+class PolarBluetoothOptionsFlow(OptionsFlow):
+    """Handle options for Polar Bluetooth.
+
+    For a sensor the max heart rate is the wearer's own and is used for their
+    zones in every group they belong to. For a group it is the default used for
+    members without one.
+    """
+
+    def __init__(self, config_entry: ConfigEntry) -> None:
+        """Initialize the options flow."""
+        self._entry = config_entry
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the max heart rate."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        if CONF_GROUP_MEMBERS in self._entry.data:
+            current = self._entry.options.get(
+                CONF_MAX_HEART_RATE,
+                self._entry.data.get(CONF_MAX_HEART_RATE, DEFAULT_MAX_HEART_RATE),
+            )
+        else:
+            current = self._entry.options.get(
+                CONF_MAX_HEART_RATE, DEFAULT_MAX_HEART_RATE
+            )
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_MAX_HEART_RATE, default=current
+                    ): MAX_HEART_RATE_SCHEMA,
+                }
+            ),
+        )
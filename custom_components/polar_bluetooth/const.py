@@ -11,7 +11,20 @@ BATTERY_LEVEL_UUID = "00002a19-0000-1000-8000-00805f9b34fb"
 # Configuration
 CONF_DEVICE_NAME = "device_name"
 CONF_DEVICE_ADDRESS = "device_address"
+CONF_GROUP_NAME = "group_name"
+CONF_GROUP_MEMBERS = "group_members"
+CONF_MAX_HEART_RATE = "max_heart_rate"
 
 # Default values
 DEFAULT_NAME = "Polar Heart Rate"
 SCAN_INTERVAL = 1  # seconds
+DEFAULT_MAX_HEART_RATE = 190
+UNIT_BEATS_PER_MINUTE = "bpm"
+GROUP_PUBLISH_INTERVAL = 1  # seconds
+
+# Heart rate zones as lower bounds in percent of max heart rate (zones 1-5)
+HEART_RATE_ZONES = (50, 60, 70, 80, 90)
+
+# Dispatcher signals for strap coordinators joining/leaving
+SIGNAL_MEMBER_ADDED = f"{DOMAIN}_member_added"
+SIGNAL_MEMBER_REMOVED = f"{DOMAIN}_member_removed"
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import asyncio
+from datetime import timedelta
 import logging
 from typing import Any
 
@@ -18,9 +19,13 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     PERCENTAGE,
     EntityCategory,
-    UnitOfFrequency,
 )
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.dispatcher import (
+    async_dispatcher_connect,
+    async_dispatcher_send,
+)
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
@@ -28,14 +33,24 @@ from homeassistant.helpers.update_coordinator import (
     UpdateFailed,
 )
 
+from .aggregate import HeartRateAggregate
 from .const import (
     BATTERY_LEVEL_UUID,
     BATTERY_SERVICE_UUID,
     CONF_DEVICE_ADDRESS,
+    CONF_GROUP_MEMBERS,
+    CONF_GROUP_NAME,
+    CONF_MAX_HEART_RATE,
+    DEFAULT_MAX_HEART_RATE,
     DOMAIN,
+    GROUP_PUBLISH_INTERVAL,
     HEART_RATE_MEASUREMENT_UUID,
     HEART_RATE_SERVICE_UUID,
+    HEART_RATE_ZONES,
     SCAN_INTERVAL,
+    SIGNAL_MEMBER_ADDED,
+    SIGNAL_MEMBER_REMOVED,
+    UNIT_BEATS_PER_MINUTE,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -47,6 +62,10 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Polar Bluetooth sensors from a config entry."""
+    if CONF_GROUP_MEMBERS in entry.data:
+        await _async_setup_group_entry(hass, entry, async_add_entities)
+        return
+    
     address = entry.data[CONF_DEVICE_ADDRESS]
     
     # Get the BLE device
@@ -62,6 +81,10 @@ async def async_setup_entry(
     coordinator = PolarDataUpdateCoordinator(hass, ble_device)
     await coordinator.async_config_entry_first_refresh()
     
+    # Make the coordinator available to groups this sensor is a member of
+    hass.data[DOMAIN][entry.entry_id] = coordinator
+    async_dispatcher_send(hass, SIGNAL_MEMBER_ADDED, entry.entry_id)
+    
     # Create sensor entities
     entities = [
         PolarHeartRateSensor(coordinator, entry),
@@ -71,6 +94,29 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
+async def _async_setup_group_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up aggregate sensors for a group of Polar sensors."""
+    coordinator = PolarGroupCoordinator(hass, entry)
+    entry.async_on_unload(coordinator.async_start())
+    await coordinator.async_config_entry_first_refresh()
+    
+    entities: list[SensorEntity] = [
+        PolarGroupAverageHeartRateSensor(coordinator, entry),
+        PolarGroupMaxHeartRateSensor(coordinator, entry),
+        PolarGroupActiveSensor(coordinator, entry),
+    ]
+    entities.extend(
+        PolarGroupZoneSensor(coordinator, entry, zone)
+        for zone in range(len(HEART_RATE_ZONES))
+    )
+    
+    async_add_entities(entities)
+
+
 class PolarDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Class to manage fetching Polar sensor data."""
 
@@ -80,12 +126,13 @@ class PolarDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self._client: BleakClient | None = None
         self._connected = False
         self._latest_heart_rate: int | None = None
+        self._latest_sensor_contact: bool | None = None
         
         super().__init__(
             hass,
             _LOGGER,
             name=f"Polar {ble_device.name}",
-            update_interval=asyncio.timedelta(seconds=SCAN_INTERVAL),
+            update_interval=timedelta(seconds=SCAN_INTERVAL),
         )
 
     async def _async_update_data(self) -> dict[str, Any]:
@@ -106,6 +153,7 @@ class PolarDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             
             # Use latest heart rate from notification
             data["heart_rate"] = self._latest_heart_rate
+            data["sensor_contact"] = self._latest_sensor_contact
             
             # Read battery level periodically
             try:
@@ -133,9 +181,7 @@ class PolarDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         _LOGGER.debug("Connecting to %s", self.ble_device.address)
         
         if self._client:
-            await self._client.disconnect()
-        
-        selftry:
+            try:
                 await self._client.stop_notify(HEART_RATE_MEASUREMENT_UUID)
             except Exception:
                 pass
@@ -149,22 +195,23 @@ class PolarDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         def heart_rate_notification_handler(sender, data):
             """Handle heart rate notifications."""
             self._latest_heart_rate = self._parse_heart_rate(data)
-            _LOGGER.debug("Received heart rate: %s BPM", self._latest_heart_rate)
+            self._latest_sensor_contact = self._parse_sensor_contact(data)
+            _LOGGER.debug("Received heart rate: %s BPM (contact: %s)",
+                          self._latest_heart_rate, self._latest_sensor_contact)
             # Trigger an update to notify entities
             self.hass.loop.call_soon_threadsafe(
                 self.async_set_updated_data, {
                     "heart_rate": self._latest_heart_rate,
+                    "sensor_contact": self._latest_sensor_contact,
                     "battery": self.data.get("battery") if self.data else None,
                 }
             )
         
         await self._client.start_notify(
             HEART_RATE_MEASUREMENT_UUID, heart_rate_notification_handler
-        )d ttry:
-                await self._client.stop_notify(HEART_RATE_MEASUREMENT_UUID)
-            except Exception:
-                pass
-            o Polar device %s", self.ble_device.name)
+        )
+        
+        _LOGGER.info("Connected to Polar device %s", self.ble_device.name)
 
     @staticmethod
     def _parse_heart_rate(data: bytearray) -> int:
@@ -182,6 +229,20 @@ class PolarDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         
         return heart_rate
 
+    @staticmethod
+    def _parse_sensor_contact(data: bytearray) -> bool | None:
+        """Parse sensor contact status from BLE characteristic data.
+
+        Returns None when the sensor does not support contact detection.
+        """
+        flags = data[0]
+        
+        # Bit 2: contact detection supported, bit 1: contact detected
+        if not flags & 0x04:
+            return None
+        
+        return bool(flags & 0x02)
+
     async def async_shutdown(self) -> None:
         """Disconnect from device on shutdown."""
         if self._client and self._connected:
@@ -193,9 +254,8 @@ class PolarDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 class PolarHeartRateSensor(CoordinatorEntity[PolarDataUpdateCoordinator], SensorEntity):
     """Representation of a Polar heart rate sensor."""
 
-    _attr_device_class = SensorDeviceClass.HEART_RATE
     _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = UnitOfFrequency.BEATS_PER_MINUTE
+    _attr_native_unit_of_measurement = UNIT_BEATS_PER_MINUTE
     _attr_icon = "mdi:heart-pulse"
 
     def __init__(
@@ -257,3 +317,235 @@ class PolarBatterySensor(CoordinatorEntity[PolarDataUpdateCoordinator], SensorEn
     def native_value(self) -> int | None:
         """Return the state of the sensor."""
         return self.coordinator.data.get("battery")
+
+
+class PolarGroupCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+    """Class to keep running aggregates over a group of Polar sensors.
+
+    Publishing to entities goes through the refresh debouncer, which bounds the
+    state write rate to one per GROUP_PUBLISH_INTERVAL.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+        """Initialize."""
+        self._members: set[str] = set(entry.data[CONF_GROUP_MEMBERS])
+        self._unsub_members: dict[str, CALLBACK_TYPE] = {}
+        self._aggregate = HeartRateAggregate(
+            entry.options.get(
+                CONF_MAX_HEART_RATE,
+                entry.data.get(CONF_MAX_HEART_RATE, DEFAULT_MAX_HEART_RATE),
+            ),
+            HEART_RATE_ZONES,
+        )
+        
+        self._publish_debouncer: Debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=GROUP_PUBLISH_INTERVAL,
+            immediate=True,
+        )
+        
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"Polar group {entry.title}",
+            request_refresh_debouncer=self._publish_debouncer,
+        )
+
+    async def _async_update_data(self) -> dict[str, Any]:
+        """Return a snapshot of the running aggregates."""
+        return self._aggregate.as_dict()
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Subscribe to member coordinators and return a callback to stop."""
+        unsubs = [
+            async_dispatcher_connect(
+                self.hass, SIGNAL_MEMBER_ADDED, self._async_attach_member
+            ),
+            async_dispatcher_connect(
+                self.hass, SIGNAL_MEMBER_REMOVED, self._async_detach_member
+            ),
+        ]
+        
+        # Members that were set up before the group
+        for member_id in self._members:
+            self._async_attach_member(member_id)
+
+        @callback
+        def _async_stop() -> None:
+            """Unsubscribe from dispatcher signals and member coordinators."""
+            for unsub in unsubs:
+                unsub()
+            for unsub in self._unsub_members.values():
+                unsub()
+            self._unsub_members.clear()
+
+        return _async_stop
+
+    @callback
+    def _async_attach_member(self, member_id: str) -> None:
+        """Start listening to a member coordinator."""
+        if member_id not in self._members:
+            return
+        
+        coordinator = self.hass.data.get(DOMAIN, {}).get(member_id)
+        if not isinstance(coordinator, PolarDataUpdateCoordinator):
+            return
+        
+        # A reloaded member comes back with a new coordinator
+        self._async_detach_member(member_id)
+        _LOGGER.debug("Group %s: attaching member %s", self.name, member_id)
+        
+        # The member's own max heart rate, if set, overrides the group default
+        max_heart_rate = None
+        if member_entry := self.hass.config_entries.async_get_entry(member_id):
+            max_heart_rate = member_entry.options.get(CONF_MAX_HEART_RATE)
+
+        @callback
+        def _async_member_updated() -> None:
+            """Handle updated data from a member coordinator."""
+            heart_rate = None
+            if (
+                coordinator.last_update_success
+                and coordinator.data
+                and coordinator.data.get("sensor_contact") is not False
+                and (coordinator.data.get("heart_rate") or 0) > 0
+            ):
+                heart_rate = coordinator.data["heart_rate"]
+            self._async_set_member_heart_rate(member_id, heart_rate, max_heart_rate)
+
+        self._unsub_members[member_id] = coordinator.async_add_listener(
+            _async_member_updated
+        )
+        _async_member_updated()
+
+    @callback
+    def _async_detach_member(self, member_id: str) -> None:
+        """Stop listening to a member coordinator and drop its contribution."""
+        if (unsub := self._unsub_members.pop(member_id, None)) is None:
+            return
+        
+        _LOGGER.debug("Group %s: detaching member %s", self.name, member_id)
+        unsub()
+        self._async_set_member_heart_rate(member_id, None)
+
+    @callback
+    def _async_set_member_heart_rate(
+        self,
+        member_id: str,
+        heart_rate: int | None,
+        max_heart_rate: int | None = None,
+    ) -> None:
+        """Replace a member's contribution to the aggregates."""
+        if self._aggregate.set_member(member_id, heart_rate, max_heart_rate):
+            self._publish_debouncer.async_schedule_call()
+
+
+class PolarGroupSensor(CoordinatorEntity[PolarGroupCoordinator], SensorEntity):
+    """Base class for Polar group sensors."""
+
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(
+        self,
+        coordinator: PolarGroupCoordinator,
+        entry: ConfigEntry,
+        key: str,
+        name: str,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        
+        group_name = entry.data[CONF_GROUP_NAME]
+        self._attr_name = f"{group_name} {name}"
+        self._attr_unique_id = f"{entry.entry_id}_{key}"
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, entry.entry_id)},
+            "name": group_name,
+            "manufacturer": "Polar",
+            "model": "Sensor Group",
+        }
+
+
+class PolarGroupAverageHeartRateSensor(PolarGroupSensor):
+    """Representation of the average heart rate of a Polar group."""
+
+    _attr_native_unit_of_measurement = UNIT_BEATS_PER_MINUTE
+    _attr_icon = "mdi:heart-pulse"
+
+    def __init__(
+        self,
+        coordinator: PolarGroupCoordinator,
+        entry: ConfigEntry,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry, "average_heart_rate", "Average Heart Rate")
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the state of the sensor."""
+        return self.coordinator.data.get("average")
+
+
+class PolarGroupMaxHeartRateSensor(PolarGroupSensor):
+    """Representation of the maximum heart rate of a Polar group."""
+
+    _attr_native_unit_of_measurement = UNIT_BEATS_PER_MINUTE
+    _attr_icon = "mdi:heart-pulse"
+
+    def __init__(
+        self,
+        coordinator: PolarGroupCoordinator,
+        entry: ConfigEntry,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry, "max_heart_rate", "Max Heart Rate")
+
+    @property
+    def native_value(self) -> int | None:
+        """Return the state of the sensor."""
+        return self.coordinator.data.get("max")
+
+
+class PolarGroupActiveSensor(PolarGroupSensor):
+    """Representation of the number of Polar sensors in contact."""
+
+    _attr_icon = "mdi:account-group"
+
+    def __init__(
+        self,
+        coordinator: PolarGroupCoordinator,
+        entry: ConfigEntry,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry, "active", "Active Sensors")
+
+    @property
+    def native_value(self) -> int:
+        """Return the state of the sensor."""
+        return self.coordinator.data.get("active", 0)
+
+
+class PolarGroupZoneSensor(PolarGroupSensor):
+    """Representation of the share of group members in a heart rate zone."""
+
+    _attr_native_unit_of_measurement = PERCENTAGE
+    _attr_icon = "mdi:chart-pie"
+
+    def __init__(
+        self,
+        coordinator: PolarGroupCoordinator,
+        entry: ConfigEntry,
+        zone: int,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(
+            coordinator, entry, f"zone_{zone + 1}", f"Zone {zone + 1} Share"
+        )
+        self._zone = zone
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the state of the sensor."""
+        return self.coordinator.data["zones"][self._zone]
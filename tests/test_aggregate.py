@@ -0,0 +1,167 @@
+"""Tests for the Polar group heart rate aggregates.
+
+The aggregate module has no Home Assistant or Bluetooth dependencies, so it is
+loaded straight from its file instead of through the integration package.
+"""
+import importlib.util
+from pathlib import Path
+import random
+
+import pytest
+
+_AGGREGATE_PATH = (
+    Path(__file__).parent.parent
+    / "custom_components"
+    / "polar_bluetooth"
+    / "aggregate.py"
+)
+_spec = importlib.util.spec_from_file_location("polar_aggregate", _AGGREGATE_PATH)
+aggregate = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(aggregate)
+
+ZONES = (50, 60, 70, 80, 90)
+MAX_HEART_RATE = 200
+
+
+def brute_force(heart_rates: dict[str, tuple[int, int | None]]) -> dict:
+    """Recompute the aggregates from scratch."""
+    values = [value for value, _ in heart_rates.values()]
+    active = len(values)
+    zone_counts = [0] * len(ZONES)
+    for value, max_heart_rate in heart_rates.values():
+        percent = value * 100 / (max_heart_rate or MAX_HEART_RATE)
+        zones = [zone for zone, bound in enumerate(ZONES) if percent >= bound]
+        if zones:
+            zone_counts[zones[-1]] += 1
+    
+    return {
+        "active": active,
+        "average": round(sum(values) / active, 1) if active else None,
+        "max": max(values) if values else None,
+        "zones": [
+            round(count * 100 / active, 1) if active else None
+            for count in zone_counts
+        ],
+    }
+
+
+@pytest.fixture
+def group():
+    """Return an empty aggregate."""
+    return aggregate.HeartRateAggregate(MAX_HEART_RATE, ZONES)
+
+
+def test_empty(group):
+    """Test the snapshot of a group without members in contact."""
+    assert group.as_dict() == {
+        "active": 0,
+        "average": None,
+        "max": None,
+        "zones": [None] * len(ZONES),
+    }
+
+
+def test_set_replace_remove(group):
+    """Test adding, replacing and removing member heart rates."""
+    assert group.set_member("a", 100)
+    assert group.set_member("b", 150)
+    assert group.as_dict()["average"] == 125
+    assert group.as_dict()["max"] == 150
+    
+    assert not group.set_member("b", 150)
+    
+    assert group.set_member("b", 120)
+    assert group.as_dict()["average"] == 110
+    assert group.as_dict()["max"] == 120
+    
+    assert group.set_member("a", None)
+    assert group.as_dict()["active"] == 1
+    assert group.as_dict()["average"] == 120
+    
+    assert not group.set_member("c", None)
+    assert group.set_member("b", None)
+    assert group.as_dict()["max"] is None
+
+
+def test_max_walks_down(group):
+    """Test the max when the top value is removed."""
+    group.set_member("a", 90)
+    group.set_member("b", 170)
+    group.set_member("c", 170)
+    group.set_member("d", 130)
+    
+    # Another member still holds the top value
+    group.set_member("b", None)
+    assert group.as_dict()["max"] == 170
+    
+    group.set_member("c", 60)
+    assert group.as_dict()["max"] == 130
+    
+    group.set_member("d", None)
+    assert group.as_dict()["max"] == 90
+
+
+@pytest.mark.parametrize(
+    ("heart_rate", "zone"),
+    [
+        (99, None),
+        (100, 0),
+        (119, 0),
+        (120, 1),
+        (179, 3),
+        (180, 4),
+        (200, 4),
+        (230, 4),
+    ],
+)
+def test_zone_boundaries(group, heart_rate, zone):
+    """Test zone boundaries, including values above the max heart rate."""
+    assert group.zone(heart_rate) == zone
+
+
+def test_zone_shares(group):
+    """Test the share of members in each zone."""
+    group.set_member("a", 80)
+    group.set_member("b", 100)
+    group.set_member("c", 180)
+    group.set_member("d", 230)
+    
+    assert group.as_dict()["zones"] == [25.0, 0.0, 0.0, 0.0, 50.0]
+
+
+def test_member_max_heart_rate(group):
+    """Test zones relative to each member's own max heart rate."""
+    assert group.zone(160, 160) == 4
+    assert group.zone(160) == 3
+    
+    group.set_member("a", 160, 160)
+    group.set_member("b", 160)
+    assert group.as_dict()["zones"] == [0.0, 0.0, 0.0, 50.0, 50.0]
+    
+    # The same heart rate against a new max moves the member between zones
+    assert group.set_member("a", 160, 320)
+    assert group.as_dict()["zones"] == [50.0, 0.0, 0.0, 50.0, 0.0]
+    
+    group.set_member("a", None)
+    assert group.as_dict()["zones"] == [0.0, 0.0, 0.0, 100.0, 0.0]
+
+
+def test_matches_brute_force(group):
+    """Test random updates against a recompute from scratch."""
+    rng = random.Random(26)
+    members = [f"strap_{index}" for index in range(12)]
+    max_heart_rates = {
+        member_id: rng.choice([None, 160, 185, 205]) for member_id in members
+    }
+    heart_rates: dict[str, tuple[int, int | None]] = {}
+    
+    for _ in range(5000):
+        member_id = rng.choice(members)
+        heart_rate = rng.choice([None, *range(40, 240)])
+        group.set_member(member_id, heart_rate, max_heart_rates[member_id])
+        if heart_rate is None:
+            heart_rates.pop(member_id, None)
+        else:
+            heart_rates[member_id] = (heart_rate, max_heart_rates[member_id])
+        
+        assert group.as_dict() == brute_force(heart_rates)